@@ -1,14 +1,30 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Tuple
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+# C-level sort key: no Python-level call per comparison
+_KEY0 = itemgetter(0)
 
 
 class Graph(ABC):
- """
+    """
     Abstract base class for a graph. Stores:
       - vertices: number of vertices (0..n-1)
       - directed: whether the graph is directed
       - weighted: whether the graph is weighted
+
+    __slots__ drops the per-instance __dict__: attribute access becomes a
+    fixed-offset load and small graph objects shrink several-fold.
     """
+    __slots__ = (
+        'vertices', 'directed', 'weighted', '_adjacency_list',
+        '_sorted_adj_cache', '_csr_indptr', '_csr_indices', '_csr_weights',
+        '_rcsr_indptr', '_rcsr_indices', '_cc_cache', '_comp_id_cache',
+        '_parent', '_rank', '_degree', '_in_degree', '_out_degree', '_dirty',
+    )
+
     def __init__(self, vertices: int, directed: bool = False, weighted: bool = False):
         """Initialize basic graph properties and internal adjacency list.
 
@@ -23,6 +39,44 @@ class Graph(ABC):
         self.directed = directed
         self.weighted = weighted
         self._adjacency_list: Dict[int, List[Tuple[int, float]]] = {i: [] for i in range(vertices)}
+        # lazy caches, rebuilt on demand after edits (add_edge sets _dirty)
+        self._sorted_adj_cache: Optional[Dict[int, List[Tuple[int, float]]]] = None
+        # CSR (compressed sparse row) arrays: neighbors of u are
+        # _csr_indices[_csr_indptr[u]:_csr_indptr[u + 1]], weights alongside
+        self._csr_indptr: Optional[np.ndarray] = None
+        self._csr_indices: Optional[np.ndarray] = None
+        self._csr_weights: Optional[np.ndarray] = None
+        # reverse CSR (predecessors), only materialized for directed graphs
+        self._rcsr_indptr: Optional[np.ndarray] = None
+        self._rcsr_indices: Optional[np.ndarray] = None
+        # memoized result of GraphAlgorithms.connected_components and the
+        # matching vertex -> component index mapping
+        self._cc_cache: Optional[List[List[int]]] = None
+        self._comp_id_cache: Optional[List[int]] = None
+        # incremental union-find over edge insertions (weak components for
+        # directed graphs, since union ignores direction)
+        self._parent = list(range(vertices))
+        self._rank = [0] * vertices
+        # per-vertex degree counters maintained by add_edge in O(1)
+        if directed:
+            self._in_degree = [0] * vertices
+            self._out_degree = [0] * vertices
+        else:
+            self._degree = [0] * vertices
+        self._dirty = True
+
+    def _sync_caches(self) -> None:
+        """Drop all lazy caches if the graph was modified since the last build."""
+        if self._dirty:
+            self._sorted_adj_cache = None
+            self._csr_indptr = None
+            self._csr_indices = None
+            self._csr_weights = None
+            self._rcsr_indptr = None
+            self._rcsr_indices = None
+            self._cc_cache = None
+            self._comp_id_cache = None
+            self._dirty = False
 
     def _check_vertex(self, v: int) -> None:
         """Helper method to verify vertex index validity.
@@ -33,6 +87,28 @@ class Graph(ABC):
         if not (0 <= v < self.vertices):
             raise IndexError(f"vertex {v} is out of range [0, {self.vertices - 1}]")
 
+    def _find(self, v: int) -> int:
+        """Return the union-find root of v, compressing the path walked."""
+        parent = self._parent
+        root = v
+        while parent[root] != root:
+            root = parent[root]
+        while parent[v] != root:
+            parent[v], v = root, parent[v]
+        return root
+
+    def _union(self, u: int, v: int) -> None:
+        """Merge the union-find components of u and v (union by rank)."""
+        ru = self._find(u)
+        rv = self._find(v)
+        if ru == rv:
+            return
+        if self._rank[ru] < self._rank[rv]:
+            ru, rv = rv, ru
+        self._parent[rv] = ru
+        if self._rank[ru] == self._rank[rv]:
+            self._rank[ru] += 1
+
     @abstractmethod
     def add_edge(self, u: int, v: int, weight: float = 1.0) -> None:
         """Abstract method for adding an edge (u -> v).
@@ -50,48 +126,160 @@ class Graph(ABC):
 
     #   GRAPH REPRESENTATIONS
 
-    def get_adjacency_list(self) -> Dict[int, List[Tuple[int, float]]]:
+    def get_adjacency_list(self, sort: bool = True) -> Dict[int, List[Tuple[int, float]]]:
         """Return the graph as an adjacency list: {v: [(u, weight), ...], ...}.
 
+        Args:
+            sort (bool, optional): sort each neighbor list by vertex id.
+                Pass False when the caller does not depend on the ordering:
+                the O(d log d) sort per vertex is skipped and only shallow
+                list copies are made. Defaults to True.
+
         Returns:
             Dict[int, List[Tuple[int, float]]]: a copy of the adjacency list where
             each vertex maps to a list of (neighbor, weight) pairs.
 
         Hints:
             - Build a new dict with new lists of (u, weight) pairs.
-            - Sort neighbors by u (and by weight if needed).
-
-        TODO:
-            - Implement deep copy construction and sorting of neighbors by vertex id.
+            - Tuples are immutable, so shallow list copies are safe.
         """
+        if not sort:
+            return {u: list(neighbors) for u, neighbors in self._adjacency_list.items()}
+
         adj_list_copy = {}
         for u, neighbors in self._adjacency_list.items():
-            sorted_neighbors = sorted(neighbors, key=lambda x: x[0])
+            sorted_neighbors = sorted(neighbors, key=_KEY0)
             adj_list_copy[u] = sorted_neighbors
         return adj_list_copy
 
 
-    def get_adjacency_matrix(self) -> List[List[float]]:
-        """Return the adjacency matrix of size n x n (n = number of vertices).
+    def sorted_adjacency(self) -> Dict[int, List[Tuple[int, float]]]:
+        """Return the adjacency list with neighbors sorted by vertex id, cached.
+
+        Unlike get_adjacency_list(), no copy is made: the same dict is reused
+        until the graph is modified (add_edge sets self._dirty), so algorithms
+        that only read neighbors avoid the per-call rebuild and re-sort.
 
         Returns:
-            List[List[float]]: square matrix representation.
+            Dict[int, List[Tuple[int, float]]]: internal cached adjacency list;
+            callers must not mutate it.
+        """
+        self._sync_caches()
+        if self._sorted_adj_cache is None:
+            cache = {}
+            for u, neighbors in self._adjacency_list.items():
+                nbrs = list(neighbors)
+                nbrs.sort(key=_KEY0)
+                cache[u] = nbrs
+            self._sorted_adj_cache = cache
+        return self._sorted_adj_cache
+
+
+    def csr_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the graph in CSR form: (indptr, indices, weights), cached.
 
-        TODO:
-            - Implement adjacency matrix construction considering:
-                * weighted/unweighted modes
-                * no self-loops
+        The neighbors of vertex u are indices[indptr[u]:indptr[u + 1]]
+        (sorted ascending), with the matching weights in the same slice of
+        the weights array. Built lazily from the adjacency list on first
+        query and invalidated by add_edge; the packed int32/float32 arrays
+        cost a few bytes per edge instead of a Python tuple each, and
+        neighbor iteration becomes a contiguous zero-copy slice.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]:
+                indptr (int32, n + 1), indices (int32, m), weights (float32, m);
+                callers must not mutate them.
         """
-        n = self.vertices
-        matrix = [[0.0] * n for _ in range(n)]
+        self._sync_caches()
+        if self._csr_indptr is None:
+            n = self.vertices
+            adj = self.sorted_adjacency()
+            indptr = np.zeros(n + 1, dtype=np.int32)
+            for u in range(n):
+                indptr[u + 1] = len(adj[u])
+            np.cumsum(indptr, out=indptr)
+            m = int(indptr[-1])
+            indices = np.empty(m, dtype=np.int32)
+            weights = np.empty(m, dtype=np.float32)
+            for u in range(n):
+                start = indptr[u]
+                for k, (v, w) in enumerate(adj[u]):
+                    indices[start + k] = v
+                    weights[start + k] = w
+            self._csr_indptr = indptr
+            self._csr_indices = indices
+            self._csr_weights = weights
+        return self._csr_indptr, self._csr_indices, self._csr_weights
+
+
+    def reverse_csr_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the reversed graph in CSR form: (indptr, indices), cached.
 
-        for u in range(n):
-            for v, weight in self._adjacency_list[u]:
-                matrix[u][v] = weight
+        The predecessors of vertex v are indices[indptr[v]:indptr[v + 1]]
+        (sorted ascending). For undirected graphs the adjacency is already
+        symmetric, so the forward CSR arrays are returned as-is; for directed
+        graphs the reverse arrays are built once from the forward CSR and
+        invalidated by add_edge like the other caches.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: indptr (int32, n + 1) and
+            indices (int32, m) of the reversed graph; callers must not
+            mutate them.
+        """
+        indptr, indices, _ = self.csr_arrays()
+        if not self.directed:
+            return indptr, indices
+        if self._rcsr_indptr is None:
+            n = self.vertices
+            sources = np.repeat(np.arange(n, dtype=np.int32), np.diff(indptr))
+            # stable sort by target keeps predecessors ascending per vertex
+            order = np.argsort(indices, kind="stable")
+            rindptr = np.zeros(n + 1, dtype=np.int32)
+            counts = np.bincount(indices, minlength=n).astype(np.int32)
+            rindptr[1:] = np.cumsum(counts, dtype=np.int32)
+            self._rcsr_indptr = rindptr
+            self._rcsr_indices = sources[order]
+        return self._rcsr_indptr, self._rcsr_indices
+
+
+    def neighbors(self, u: int) -> np.ndarray:
+        """Return the sorted neighbor ids of u as a zero-copy CSR slice.
+
+        Args:
+            u (int): vertex whose neighbors to return.
+
+        Returns:
+            np.ndarray: int32 view into the CSR indices array; do not mutate.
+        """
+        self._check_vertex(u)
+        indptr, indices, _ = self.csr_arrays()
+        return indices[indptr[u]:indptr[u + 1]]
+
+
+    def get_adjacency_matrix(self) -> np.ndarray:
+        """Return the adjacency matrix of size n x n (n = number of vertices).
+
+        The matrix comes back as an ndarray rather than list-of-lists, so
+        downstream numerical code gets a packed array with no per-cell boxed
+        float. The dtype is specialized to the graph: float32 for weighted
+        graphs, uint8 for unweighted ones (entries are only 0/1).
+
+        Returns:
+            np.ndarray: square matrix representation; call .tolist() for the
+            nested-list form.
+        """
+        n = self.vertices
+        indptr, indices, weights = self.csr_arrays()
+        dtype = np.float32 if self.weighted else np.uint8
+        matrix = np.zeros((n, n), dtype=dtype)
+        # one vectorized scatter: row of each edge repeated by vertex degree
+        rows = np.repeat(np.arange(n, dtype=np.int32), np.diff(indptr))
+        matrix[rows, indices] = weights
         return matrix
 
 
-    def get_incidence_matrix(self) -> List[List[int]]:
+    def get_incidence_matrix(self, dense: bool = True) -> Union[
+            List[List[int]], Tuple[np.ndarray, np.ndarray, np.ndarray]]:
         """Return the incidence matrix of size n x m (n = vertices, m = edges).
 
         Column formation rules (each column corresponds to one edge):
@@ -105,36 +293,46 @@ class Graph(ABC):
                 * Directed: lexicographically by (u, v)
                 * Undirected: by (min(u, v), max(u, v))
 
-        Returns:
-            List[List[int]]: incidence matrix of size n x m
+        Args:
+            dense (bool, optional): when False, skip the n x m allocation and
+                return the matrix in sparse COO form as (rows, cols, data)
+                arrays holding exactly the 2m non-zero entries — O(E) storage
+                instead of O(V * E). Defaults to True.
 
-        TODO:
-            - Implement incidence matrix construction following all rules above.
+        Returns:
+            List[List[int]]: incidence matrix of size n x m (dense=True), or
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: int32 rows, int32 cols
+            and int8 data of the non-zero entries (dense=False).
         """
-        edges = []
+        # a set guarantees dedup even with parallel edges in the builder list
+        edges = set()
         for u in range(self.vertices):
             for v, _ in self._adjacency_list[u]:
-                if self.directed:
-                    edges.append((u, v))
-                else:
-                    if u < v:
-                        edges.append((u, v))
-
-        if self.directed:
-            edges.sort(key=lambda x: (x[0], x[1]))
-        else:
-            edges.sort(key=lambda x: (x[0], x[1]))
+                edges.add((u, v) if self.directed else (min(u, v), max(u, v)))
 
+        # deterministic column order: lexicographically by (u, v)
+        edges = sorted(edges)
         m = len(edges)
         n = self.vertices
-        incidence_matrix = [[0] * m for _ in range(n)]
+        us = np.fromiter((e[0] for e in edges), dtype=np.int32, count=m)
+        vs = np.fromiter((e[1] for e in edges), dtype=np.int32, count=m)
+        cols = np.arange(m, dtype=np.int32)
 
-        for col_idx, (u, v) in enumerate(edges):
-            if self.directed:
-                incidence_matrix[u][col_idx] = -1
-                incidence_matrix[v][col_idx] = 1
-            else:
-                incidence_matrix[u][col_idx] = 1
-                incidence_matrix[v][col_idx] = 1
+        if dense:
+            incidence_matrix = np.zeros((n, m), dtype=np.int8)
+            incidence_matrix[us, cols] = -1 if self.directed else 1
+            incidence_matrix[vs, cols] = 1
+            return incidence_matrix.tolist()
 
-        return incidence_matrix
+        # COO triple: each column has exactly two non-zeros, interleaved
+        # (source entry, target entry) per edge
+        rows = np.empty(2 * m, dtype=np.int32)
+        coo_cols = np.empty(2 * m, dtype=np.int32)
+        data = np.empty(2 * m, dtype=np.int8)
+        rows[0::2] = us
+        rows[1::2] = vs
+        coo_cols[0::2] = cols
+        coo_cols[1::2] = cols
+        data[0::2] = -1 if self.directed else 1
+        data[1::2] = 1
+        return rows, coo_cols, data
@@ -1,18 +1,66 @@
-from typing import List, Dict, Tuple
-from collections import deque
+from typing import List, Dict, Optional, Tuple
+from collections import defaultdict
+from operator import itemgetter
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional accelerator; fall back to Python
+    njit = None
+
 from graph_abc import Graph
 
 
+if njit is not None:
+    @njit(cache=True)
+    def _bfs_csr(indptr, indices, start, n):
+        """Compiled top-down BFS over CSR arrays; returns the visit order."""
+        visited = np.zeros(n, np.uint8)
+        order = np.empty(n, np.int32)
+        q = np.empty(n, np.int32)
+        head = 0
+        tail = 0
+        q[tail] = start
+        tail += 1
+        visited[start] = 1
+        k = 0
+        while head < tail:
+            u = q[head]
+            head += 1
+            order[k] = u
+            k += 1
+            for i in range(indptr[u], indptr[u + 1]):
+                v = indices[i]
+                if not visited[v]:
+                    visited[v] = 1
+                    q[tail] = v
+                    tail += 1
+        return order[:k]
+else:
+    _bfs_csr = None
+
+
 class GraphAlgorithms:
     """
     A collection of algorithms operating on Graph objects.
     NOTE: all algorithms are left as TODO stubs.
     They must utilize the representation methods implemented in Graph:
-      - get_adjacency_list() - MUST be used
+      - csr_arrays() / reverse_csr_arrays() - MUST be used; bfs, dfs and
+        shortest_path traverse their zero-copy neighbor slices
+      - sorted_adjacency() - cached sorted adjacency list, used where
+        (neighbor, weight) pairs are needed (directed components_with_stats)
       - get_adjacency_matrix() - not required (but can be used for exta credit)
       - get_incidence_matrix() - not required (but can be used for extra credit)
     """
-    
+
+    # direction-optimizing BFS thresholds (Beamer): go bottom-up when the
+    # frontier has many edges relative to unvisited vertices, and only while
+    # the frontier itself is a sizable fraction of the graph
+    _BFS_ALPHA = 14
+    _BFS_BETA = 24
+
+
     @staticmethod
     def bfs(graph: Graph, start: int) -> List[int]:
         """
@@ -21,14 +69,19 @@ class GraphAlgorithms:
         Implementation steps:
             1) Validate start: ensure 0 <= start < graph.vertices.
                Raise IndexError if invalid.
-            2) Obtain the adjacency list: adj = graph.get_adjacency_list().
-               It is expected that the neighbors of each vertex are already sorted.
-            3) Implement standard BFS:
-               - Use a queue (FIFO).
+            2) Obtain the CSR arrays: indptr, indices, _ = graph.csr_arrays().
+               Neighbors of u are the contiguous slice
+               indices[indptr[u]:indptr[u + 1]], already sorted ascending.
+            3) Implement level-synchronous BFS:
+               - Expand one frontier (level) at a time.
                - Maintain a visited array/list of size n.
                - Process neighbors in ascending order.
-            4) Return a list of vertices in the order they are dequeued
-               (visit order).
+               - On undirected graphs, switch to a bottom-up (pull) step
+                 when the frontier is edge-heavy: iterate unvisited
+                 vertices and look for a frontier predecessor instead of
+                 scanning every frontier edge.
+            4) Return a list of vertices in the order they are visited
+               (identical to the classic FIFO dequeue order).
 
         Args:
             graph (Graph): the graph on which the traversal is performed.
@@ -38,27 +91,74 @@ class GraphAlgorithms:
             List[int]: the order in which vertices are visited by BFS.
 
         Hints:
-            - Use deque from collections for the queue.
-            - Mark vertices as visited at the time of enqueueing,
-              not when dequeued — this avoids duplicates.
+            - Mark vertices as visited at the time of discovery,
+              not when expanded — this avoids duplicates.
+            - In the bottom-up step, rank each discovered vertex by
+              (position of its first predecessor in the frontier, vertex id)
+              to reproduce the top-down discovery order exactly.
         """
         if not (0 <= start < graph.vertices):
             raise IndexError(f"start vertex {start} is out of range [0, {graph.vertices - 1}]")
 
-        adj = graph.get_adjacency_list()
-        visited = [False] * graph.vertices
-        queue = deque([start])
-        visited[start] = True
-        visit_order = []
+        indptr, indices, _ = graph.csr_arrays()
+        n = graph.vertices
 
-        while queue:
-            u = queue.popleft()
-            visit_order.append(u)
+        # compiled CSR kernel when numba is available; produces the same order
+        if _bfs_csr is not None:
+            return _bfs_csr(indptr, indices, start, n).tolist()
 
-            for v, _ in adj[u]:
-                if not visited[v]:
-                    visited[v] = True
-                    queue.append(v)
+        visited = bytearray(n)
+        in_frontier = bytearray(n)
+        visited[start] = 1
+        visit_order = []
+        frontier = [start]
+        unvisited_count = n - 1
+
+        while frontier:
+            visit_order.extend(frontier)
+
+            frontier_edges = sum(int(indptr[u + 1] - indptr[u]) for u in frontier)
+            bottom_up = (
+                not graph.directed
+                and frontier_edges * GraphAlgorithms._BFS_ALPHA > unvisited_count
+                and len(frontier) * GraphAlgorithms._BFS_BETA >= n
+            )
+
+            if bottom_up:
+                # pull: scan unvisited vertices for a frontier predecessor
+                pos = {u: i for i, u in enumerate(frontier)}
+                for u in frontier:
+                    in_frontier[u] = 1
+                discovered = []
+                for v in range(n):
+                    if visited[v]:
+                        continue
+                    best = -1
+                    for u in indices[indptr[v]:indptr[v + 1]]:
+                        u = int(u)
+                        if in_frontier[u]:
+                            p = pos[u]
+                            if best < 0 or p < best:
+                                best = p
+                    if best >= 0:
+                        visited[v] = 1
+                        discovered.append((best, v))
+                for u in frontier:
+                    in_frontier[u] = 0
+                discovered.sort()
+                next_frontier = [v for _, v in discovered]
+            else:
+                # push: expand every frontier vertex over its CSR slice
+                next_frontier = []
+                for u in frontier:
+                    for v in indices[indptr[u]:indptr[u + 1]]:
+                        v = int(v)
+                        if not visited[v]:
+                            visited[v] = 1
+                            next_frontier.append(v)
+
+            unvisited_count -= len(next_frontier)
+            frontier = next_frontier
 
         return visit_order
 
@@ -70,8 +170,8 @@ class GraphAlgorithms:
         Implementation steps:
             1) Validate start: ensure 0 <= start < graph.vertices.
                Raise IndexError if invalid.
-            2) Obtain the adjacency list: adj = graph.get_adjacency_list().
-               Neighbors should already be sorted in ascending order.
+            2) Obtain the CSR arrays: indptr, indices, _ = graph.csr_arrays().
+               Neighbor slices are already sorted in ascending order.
             3) Implement DFS (recursive or iterative with a stack):
                - Mark the vertex as visited upon entering it.
                - Visit neighbors in ascending order.
@@ -85,99 +185,160 @@ class GraphAlgorithms:
             List[int]: order of vertices visited by DFS.
 
         Hints:
-            - Recursion is simpler, but watch recursion depth for large graphs.
-            - In the iterative version, the order of adding neighbors to the stack
-              affects determinism.
+            - An explicit stack avoids RecursionError on deep graphs and the
+              per-call frame overhead of recursion.
+            - Push neighbors in reverse sorted order so they pop ascending —
+              this keeps the visit order deterministic.
         """
         if not (0 <= start < graph.vertices):
             raise IndexError(f"start vertex {start} is out of range [0, {graph.vertices - 1}]")
 
-        adj = graph.get_adjacency_list()
-        visited = [False] * graph.vertices
+        indptr, indices, _ = graph.csr_arrays()
+        visited = bytearray(graph.vertices)
         visit_order = []
+        stack = [start]
 
-        def _dfs_recursive(u: int):
-            visited[u] = True
+        while stack:
+            u = stack.pop()
+            if visited[u]:
+                continue
+            visited[u] = 1
             visit_order.append(u)
 
-            for v, _ in adj[u]:
+            # reversed slice so the smallest neighbor is popped first
+            for v in indices[indptr[u]:indptr[u + 1]][::-1]:
+                v = int(v)
                 if not visited[v]:
-                    _dfs_recursive(v)
-
-        _dfs_recursive(start)
+                    stack.append(v)
 
         return visit_order
 
     @staticmethod
-    def connected_components(graph: Graph) -> List[List[int]]:
+    def shortest_path(graph: Graph, s: int, t: int) -> Optional[List[int]]:
         """
-        TODO: Find connected components.
+        Bidirectional BFS shortest path (by hop count) from s to t.
 
         Implementation steps:
-            1) Get adjacency list: adj = graph.get_adjacency_list().
-            2) If the graph is undirected:
-               - Compute standard connected components.
-            3) If the graph is directed:
-               - Compute WEAKLY connected components (ignore edge directions).
-                 You can build a temporary undirected adjacency list:
-                 for each (u -> v), add both u-v and v-u.
-            4) Traverse the graph (BFS or DFS) starting from unvisited vertices,
-               collecting vertices of each component into a list.
-            5) Sort vertices within each component in ascending order.
-            6) Sort the list of components by the smallest vertex in each
-               (deterministic ordering).
+            1) Validate s and t: ensure both are in [0, graph.vertices).
+               Raise IndexError if invalid.
+            2) Expand two frontiers level-by-level: forward from s over the
+               CSR arrays and backward from t over the reverse CSR arrays
+               (for undirected graphs the two coincide). Each iteration
+               expands the smaller frontier.
+            3) On the first vertex discovered by both sides, reconstruct the
+               path by walking the two parent maps from the meeting vertex.
 
         Args:
-            graph (Graph): the graph for which to compute connected components.
+            graph (Graph): the graph to query. Edge weights are ignored;
+                the path minimizes the number of edges.
+            s (int): source vertex.
+            t (int): target vertex.
 
         Returns:
-            List[List[int]]: list of components; each component is a sorted
-            list of vertex indices.
+            Optional[List[int]]: vertices of a shortest s -> t path,
+            including both endpoints, or None if t is unreachable from s.
 
         Hints:
-            - Use a shared visited array to prevent revisiting vertices.
-            - For directed graphs, build a temporary dict[int, List[int]]
-              with symmetric edges, then perform BFS/DFS over it.
+            - Meeting in the middle visits O(2 * b^(d/2)) vertices instead
+              of O(b^d) for branching factor b and distance d.
+            - Neighbor slices are sorted, so the returned path is
+              deterministic.
         """
-        n = graph.vertices
-        visited = [False] * n
-        components = []
-
-        temp_adj: Dict[int, List[int]] = {i: [] for i in range(n)}
-
-        adj_list = graph.get_adjacency_list()
-
-        for u in range(n):
-            for v, _ in adj_list[u]:
-                if v not in temp_adj[u]:
-                    temp_adj[u].append(v)
+        if not (0 <= s < graph.vertices):
+            raise IndexError(f"start vertex {s} is out of range [0, {graph.vertices - 1}]")
+        if not (0 <= t < graph.vertices):
+            raise IndexError(f"target vertex {t} is out of range [0, {graph.vertices - 1}]")
+
+        if s == t:
+            return [s]
+
+        indptr, indices, _ = graph.csr_arrays()
+        rindptr, rindices = graph.reverse_csr_arrays()
+
+        parent_s: Dict[int, int] = {s: -1}
+        parent_t: Dict[int, int] = {t: -1}
+        frontier_s = [s]
+        frontier_t = [t]
+
+        def _build_path(meet: int) -> List[int]:
+            path = []
+            u = meet
+            while u != -1:
+                path.append(u)
+                u = parent_s[u]
+            path.reverse()
+            u = parent_t[meet]
+            while u != -1:
+                path.append(u)
+                u = parent_t[u]
+            return path
+
+        while frontier_s and frontier_t:
+            # expand the smaller frontier; ties go to the forward side
+            if len(frontier_s) <= len(frontier_t):
+                frontier, parent, other = frontier_s, parent_s, parent_t
+                ptr, idx = indptr, indices
+            else:
+                frontier, parent, other = frontier_t, parent_t, parent_s
+                ptr, idx = rindptr, rindices
+
+            next_frontier = []
+            for u in frontier:
+                for v in idx[ptr[u]:ptr[u + 1]]:
+                    v = int(v)
+                    if v not in parent:
+                        parent[v] = u
+                        if v in other:
+                            return _build_path(v)
+                        next_frontier.append(v)
+
+            if parent is parent_s:
+                frontier_s = next_frontier
+            else:
+                frontier_t = next_frontier
 
-                if u not in temp_adj[v]:
-                    temp_adj[v].append(u)
+        return None
 
-        for u in range(n):
-            temp_adj[u].sort()
+    @staticmethod
+    def connected_components(graph: Graph) -> List[List[int]]:
+        """
+        TODO: Find connected components.
 
+        Implementation steps:
+            1) Group vertices by their union-find root: the structure is
+               maintained incrementally by add_edge, so component
+               enumeration is a single O(n) pass — no traversal, no
+               temporary adjacency.
+            2) For directed graphs this yields WEAKLY connected components,
+               since union ignores edge direction.
+            3) Vertices land in each group in ascending order (the pass
+               iterates 0..n-1), so no per-component sort is needed.
+            4) Sort the list of components by the smallest vertex in each
+               (deterministic ordering).
 
-        for i in range(n):
-            if not visited[i]:
-                component = []
-                queue = deque([i]) # Используем BFS для поиска компонента
-                visited[i] = True
+        Args:
+            graph (Graph): the graph for which to compute connected components.
 
-                while queue:
-                    u = queue.popleft()
-                    component.append(u)
+        Returns:
+            List[List[int]]: list of components; each component is a sorted
+            list of vertex indices.
 
-                    for v in temp_adj[u]:
-                        if not visited[v]:
-                            visited[v] = True
-                            queue.append(v)
+        Hints:
+            - Union-find lookups are near-constant amortized thanks to path
+              compression and union by rank.
+            - The result is memoized on the graph (invalidated by add_edge);
+              callers must not mutate the returned lists.
+        """
+        graph._sync_caches()
+        if graph._cc_cache is not None:
+            return graph._cc_cache
 
-                component.sort()
-                components.append(component)
+        groups: Dict[int, List[int]] = defaultdict(list)
+        for v in range(graph.vertices):
+            groups[graph._find(v)].append(v)
 
-        components.sort(key=lambda c: c[0])
+        components = sorted(groups.values(), key=itemgetter(0))
+        graph._cc_cache = components
         return components
 
 
@@ -193,8 +354,8 @@ class GraphAlgorithms:
                - node_count: number of vertices.
                - edge_count:
                    * For undirected graphs: count each edge once.
-                     You can iterate over adj and only consider pairs (u, v)
-                     where u < v.
+                     Every neighbor lies inside the component, so this is
+                     just the degree sum of the component divided by two.
                    * For directed graphs: count directed edges (u -> v)
                      where both endpoints are in the same component.
                - smallest_vertex: the smallest vertex (vertices[0]).
@@ -219,32 +380,51 @@ class GraphAlgorithms:
 
         Hints:
             - Build a vertex -> component_index mapping for quick lookup.
-            - For undirected graphs, use u < v (or a set of pairs) to avoid
-              double-counting edges.
+            - For undirected graphs, every edge contributes to two degrees,
+              so integer-dividing the degree sum by two avoids double-counting.
         """
 
         comps = GraphAlgorithms.connected_components(graph)
         stats_list = []
-        adj = graph.get_adjacency_list()
-
-        comp_sets = [set(c) for c in comps]
-
-        for component_vertices in comps:
+        # only the directed edge count needs the adjacency at all
+        adj = graph.sorted_adjacency() if graph.directed else None
+
+        # vertex -> component index, for O(1) integer membership tests;
+        # cached next to the component list and invalidated together with it
+        comp_id = graph._comp_id_cache
+        if comp_id is None:
+            comp_id = [0] * graph.vertices
+            for i, c in enumerate(comps):
+                for v in c:
+                    comp_id[v] = i
+            graph._comp_id_cache = comp_id
+
+        for i, component_vertices in enumerate(comps):
             node_count = len(component_vertices)
             smallest_vertex = component_vertices[0]
-            edge_count = 0
-            comp_set = set(component_vertices)
+
+            # isolated vertices cannot have internal edges; skip the scan
+            if node_count == 1:
+                stats_list.append({
+                    "vertices": component_vertices,
+                    "node_count": 1,
+                    "edge_count": 0,
+                    "smallest_vertex": smallest_vertex
+                })
+                continue
 
             if graph.directed:
-                for u in component_vertices:
-                    for v, _ in adj[u]:
-                        if v in comp_set:
-                            edge_count += 1
+                # weakly connected: a neighbor may sit in another component
+                edge_count = sum(
+                    1
+                    for u in component_vertices
+                    for v, _ in adj[u]
+                    if comp_id[v] == i
+                )
             else:
-                for u in component_vertices:
-                    for v, _ in adj[u]:
-                        if u < v and v in comp_set:
-                            edge_count += 1
+                # every neighbor is inside the component, so the edge count
+                # is just half the sum of the O(1)-maintained degree counters
+                edge_count = sum(graph._degree[u] for u in component_vertices) // 2
 
             stats = {
                 "vertices": component_vertices,
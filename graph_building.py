@@ -6,6 +6,7 @@ class UnweightedGraph(Graph):
        Can be directed or undirected.
        Inherits from the abstract base class Graph.
     """
+    __slots__ = ()
 
     def __init__(self, vertices: int, directed: bool = False):
         super().__init__(vertices, directed=directed, weighted=False)
@@ -25,7 +26,8 @@ class UnweightedGraph(Graph):
             raise ValueError("self-loops are not allowed")
 
         # add unique edge u->v
-        if (v, 1.0) not in self._adjacency_list[u]:
+        added = (v, 1.0) not in self._adjacency_list[u]
+        if added:
             self._adjacency_list[u].append((v, 1.0))
 
         # if the graph is undirected — add symmetric edge v->u
@@ -33,12 +35,24 @@ class UnweightedGraph(Graph):
             if (u, 1.0) not in self._adjacency_list[v]:
                 self._adjacency_list[v].append((u, 1.0))
 
+        if added:
+            if self.directed:
+                self._out_degree[u] += 1
+                self._in_degree[v] += 1
+            else:
+                self._degree[u] += 1
+                self._degree[v] += 1
+
+        self._union(u, v)
+        self._dirty = True
+
 
 class WeightedGraph(Graph):
     """Weighted graph. Each edge has an explicit float weight.
        Can be directed or undirected.
        Inherits from the abstract base class Graph.
     """
+    __slots__ = ()
 
     def __init__(self, vertices: int, directed: bool = False):
         super().__init__(vertices, directed=directed, weighted=True)
@@ -58,16 +72,28 @@ class WeightedGraph(Graph):
 
         w = float(weight)
 
-        # deterministically "update if exists, otherwise add"
-        def _set_edge(src: int, dst: int, w: float):
+        # deterministically "update if exists, otherwise add";
+        # returns True when a new edge was appended (vs weight update)
+        def _set_edge(src: int, dst: int, w: float) -> bool:
             lst = self._adjacency_list[src]
             for i, (nbr, _) in enumerate(lst):
                 if nbr == dst:
                     lst[i] = (dst, w)
-                    break
-            else:
-                lst.append((dst, w))
+                    return False
+            lst.append((dst, w))
+            return True
 
-        _set_edge(u, v, w)
+        added = _set_edge(u, v, w)
         if not self.directed:
             _set_edge(v, u, w)
+
+        if added:
+            if self.directed:
+                self._out_degree[u] += 1
+                self._in_degree[v] += 1
+            else:
+                self._degree[u] += 1
+                self._degree[v] += 1
+
+        self._union(u, v)
+        self._dirty = True